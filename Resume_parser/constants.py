@@ -5,6 +5,7 @@ import textwrap
 from typing import Dict, List
 
 import pandas as pd
+import streamlit as st
 
 PRIMARY_COLOR = "#007BFF"
 ACCENT_COLOR = "#10B981"
@@ -211,7 +212,7 @@ RECOMMENDATION_COLORS = {
 MAX_TOP_CANDIDATES = 7
 
 
+@st.cache_resource(show_spinner=False)
 def load_default_candidates() -> pd.DataFrame:
-    """Return a DataFrame copy of the seed candidate dataset."""
-    df = pd.DataFrame(DEFAULT_CANDIDATES)
-    return df.copy()
+    """Return the seed candidate dataset, shared read-only across sessions."""
+    return pd.DataFrame(DEFAULT_CANDIDATES)
@@ -1,6 +1,8 @@
 """Custom CSS styles and fonts for the Eureka - AI Talent Discovery Engine."""
+from functools import cache
 
 
+@cache
 def apply_custom_css() -> str:
     """Returns Eureka enterprise CSS string."""
     return """
@@ -94,6 +96,18 @@ def apply_custom_css() -> str:
         transform: translateY(-4px);
     }
     
+    .candidate-grid {
+        display: grid;
+        grid-template-columns: repeat(3, minmax(0, 1fr));
+        gap: 0 1rem;
+    }
+    
+    @media (max-width: 640px) {
+        .candidate-grid {
+            grid-template-columns: minmax(0, 1fr);
+        }
+    }
+    
     .candidate-card {
         background: linear-gradient(135deg, rgba(255, 255, 255, 0.96) 0%, rgba(240, 249, 255, 0.9) 100%);
         backdrop-filter: blur(14px);
@@ -4,10 +4,13 @@ A polished enterprise UI for AI-powered resume screening, ranking, and monitorin
 """
 from __future__ import annotations
 
-import json
-from typing import Dict, Optional
+import io
+from string import Template
+from typing import Dict, Optional, Tuple
 
+import orjson
 import pandas as pd
+import pyarrow as pa
 import streamlit as st
 
 from .constants import (
@@ -18,8 +21,9 @@ from .constants import (
 )
 from .css_styles import apply_custom_css
 from .utils import (
+    SkillIndex,
     apply_column_mapping,
-    chunked,
+    build_skill_index,
     compute_summary_metrics,
     fetch_google_sheet,
     parse_uploaded_file,
@@ -27,6 +31,44 @@ from .utils import (
     top_candidates,
 )
 
+REC_CLASS = {
+    "Strong": "recommendation-strong",
+    "Balanced": "recommendation-balanced",
+}
+
+CANDIDATE_CARD_TEMPLATE = Template(
+    """<div class="screening-box candidate-card">
+    <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 1rem;">
+        <h4 style="margin: 0; color: var(--text-primary);">$full_name</h4>
+        <span class="recommendation-badge $rec_class">$recommendation</span>
+    </div>
+    <p style="margin: 0.5rem 0; font-size: 0.9rem;"><strong>Score:</strong> $match_score</p>
+    <p style="margin: 0.5rem 0; font-size: 0.9rem;"><strong>Role:</strong> $current_role</p>
+    <p style="margin: 0.5rem 0; font-size: 0.9rem;"><strong>Experience:</strong> $experience_years years</p>
+    <p style="margin: 0.5rem 0; font-size: 0.9rem;"><strong>Location:</strong> $location</p>
+    <p style="margin: 0.5rem 0; font-size: 0.9rem;"><strong>Work Model:</strong> $work_model</p>
+</div>"""
+)
+
+CANDIDATE_PROFILE_TEMPLATE = Template(
+    """<div class="screening-box">
+    <div style="display: flex; justify-content: space-between; align-items: center;">
+        <h3 style="margin: 0; color: var(--text-primary);">$full_name</h3>
+        <span class="recommendation-badge $rec_class">$recommendation</span>
+    </div>
+    <hr style="margin: 1rem 0;">
+    <p><strong>Match Score:</strong> $match_score</p>
+    <p><strong>Current Role:</strong> $current_role</p>
+    <p><strong>Experience:</strong> $experience_years years</p>
+    <p><strong>Email:</strong> $email</p>
+    <p><strong>Location:</strong> $location</p>
+    <p><strong>Work Model:</strong> $work_model</p>
+    <p><strong>Availability:</strong> $availability</p>
+    <hr style="margin: 1rem 0;">
+    <p><strong>Skills:</strong> $skills</p>
+</div>"""
+)
+
 st.set_page_config(
     page_title="Eureka | AI Talent Discovery Engine",
     page_icon="🔍",
@@ -47,16 +89,81 @@ st.markdown(
 )
 
 
+@st.cache_data(show_spinner=False)
+def _cached_parse(file_bytes: bytes, name: str) -> pd.DataFrame:
+    """Parse an uploaded file once per unique payload."""
+    buffer = io.BytesIO(file_bytes)
+    buffer.name = name
+    return parse_uploaded_file(buffer)
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_sheet(sheet_value: str) -> pd.DataFrame:
+    """Fetch a Google Sheet, reusing the result for five minutes."""
+    return fetch_google_sheet(sheet_value)
+
+
+def _frame_digest(df: pd.DataFrame) -> Tuple[Tuple[str, ...], bytes]:
+    """Hash a DataFrame whose object or Arrow list columns may hold lists (e.g. ``skills``)."""
+    nested = [
+        column
+        for column, dtype in df.dtypes.items()
+        if dtype == object or (isinstance(dtype, pd.ArrowDtype) and pa.types.is_nested(dtype.pyarrow_dtype))
+    ]
+    hashable = df.astype({column: str for column in nested})
+    return tuple(df.columns), pd.util.hash_pandas_object(hashable, index=False).to_numpy().tobytes()
+
+
+FRAME_HASH_FUNCS = {pd.DataFrame: _frame_digest}
+
+
+@st.cache_data(show_spinner=False, hash_funcs=FRAME_HASH_FUNCS)
+def _cached_score(
+    df: pd.DataFrame,
+    job_title: str,
+    job_description: str,
+    weights: Tuple[Tuple[str, int], ...],
+    preferred_work_model: str,
+    minimum_experience: int,
+    _skill_index: Optional[SkillIndex] = None,
+) -> pd.DataFrame:
+    """Score candidates once per unique dataset and screening configuration."""
+    return score_candidates(
+        df,
+        job_title=job_title,
+        job_description=job_description,
+        weights=dict(weights),
+        preferred_work_model=preferred_work_model,
+        minimum_experience=minimum_experience,
+        skill_index=_skill_index,
+    )
+
+
+def _serialize_export(scored_df: pd.DataFrame, top_df: pd.DataFrame, screen_config: Dict[str, object]) -> bytes:
+    """Encode the rankings export; called once per screening run."""
+    export_data = {
+        "screen_config": screen_config,
+        "top_candidates": top_df.to_dict(orient="records"),
+        "all_rankings": scored_df.to_dict(orient="records"),
+    }
+    return orjson.dumps(
+        export_data,
+        default=str,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+    )
+
+
 def initialize_session_state():
     """Centralized session state initialization."""
-    if "candidates_df" not in st.session_state:
-        st.session_state["candidates_df"] = load_default_candidates()
-    if "scored_df" not in st.session_state:
-        st.session_state["scored_df"] = None
-    if "screen_config" not in st.session_state:
-        st.session_state["screen_config"] = DEFAULT_SCREEN_CONFIG.copy()
-    if "ingestion_status" not in st.session_state:
-        st.session_state["ingestion_status"] = []
+    if st.session_state.get("_initialized"):
+        return
+    state = st.session_state
+    candidates_df = state.setdefault("candidates_df", load_default_candidates())
+    state.setdefault("skill_index", build_skill_index(candidates_df["skills"]))
+    state.setdefault("scored_df", None)
+    state.setdefault("screen_config", DEFAULT_SCREEN_CONFIG.copy())
+    state.setdefault("ingestion_status", [])
+    state["_initialized"] = True
 
 
 def set_ingestion_status(steps):
@@ -82,6 +189,7 @@ def render_processing_status():
         st.markdown("</div>", unsafe_allow_html=True)
 
 
+@st.fragment
 def tab_load_candidates():
 
     """Tab 1: Data Ingestion (Local Upload + Google Sheets)."""
@@ -92,11 +200,11 @@ def tab_load_candidates():
 
     with col1:
         with st.expander("📂 Local Resume Upload", expanded=False):
-            st.caption("Upload CSV, Excel, or JSON files with candidate resumes")
+            st.caption("Upload CSV, Excel, JSON, or Parquet files with candidate resumes")
             uploaded_file = st.file_uploader(
                 "Choose file",
-                type=["csv", "xlsx", "xls", "json"],
-                help="Supported formats: CSV, XLSX, XLS, JSON",
+                type=["csv", "xlsx", "xls", "json", "parquet"],
+                help="Supported formats: CSV, XLSX, XLS, JSON, Parquet",
                 label_visibility="collapsed",
             )
 
@@ -104,7 +212,7 @@ def tab_load_candidates():
                 if st.button("🔄 Process Local File", use_container_width=True, type="primary"):
                     with st.spinner("Processing local file..."):
                         try:
-                            raw_df = parse_uploaded_file(uploaded_file)
+                            raw_df = _cached_parse(uploaded_file.getvalue(), uploaded_file.name)
                             st.session_state["raw_upload"] = raw_df
                             set_ingestion_status(
                                 [
@@ -114,9 +222,8 @@ def tab_load_candidates():
                             )
                             st.success(f"✓ Loaded {len(raw_df)} records from {uploaded_file.name}")
                             with st.expander("📊 Preview Raw Data"):
-                                st.data_editor(
-                                    raw_df.head(5),
-                                    disabled=True,
+                                st.dataframe(
+                                    raw_df.head(5).convert_dtypes(dtype_backend="pyarrow"),
                                     use_container_width=True,
                                 )
                         except Exception as exc:
@@ -135,7 +242,7 @@ def tab_load_candidates():
             if st.button("📥 Load from Google Sheets", use_container_width=True, type="primary"):
                 with st.spinner("Fetching Google Sheets data..."):
                     try:
-                        raw_df = fetch_google_sheet(sheet_url)
+                        raw_df = _cached_sheet(sheet_url.strip())
                         st.session_state["raw_upload"] = raw_df
                         set_ingestion_status(
                             [
@@ -145,9 +252,8 @@ def tab_load_candidates():
                         )
                         st.success(f"✓ Loaded {len(raw_df)} records from Google Sheets")
                         with st.expander("📊 Preview Raw Data"):
-                            st.data_editor(
-                                raw_df.head(5),
-                                disabled=True,
+                            st.dataframe(
+                                raw_df.head(5).convert_dtypes(dtype_backend="pyarrow"),
                                 use_container_width=True,
                             )
                     except Exception as exc:
@@ -174,45 +280,37 @@ def tab_load_candidates():
         col_load_1, col_load_2, col_load_3 = st.columns([1, 2, 1])
         with col_load_2:
             if st.button("✅ Apply Mapping & Load Candidates", use_container_width=True, type="primary"):
-                with st.container():
-                    progress_placeholder = st.empty()
-                    status_placeholder = st.empty()
-
-                    try:
-                        progress_placeholder.progress(0.2)
-                        status_placeholder.info("⏳ Validating columns...")
+                status_placeholder = st.empty()
+                try:
+                    with st.spinner("Loading candidates..."):
                         normalized_df = apply_column_mapping(raw_df, mapping)
-
-                        progress_placeholder.progress(0.6)
-                        status_placeholder.info("⏳ Normalizing data...")
                         st.session_state["candidates_df"] = normalized_df
+                        st.session_state["skill_index"] = build_skill_index(normalized_df["skills"])
                         st.session_state["scored_df"] = None
-
-                        progress_placeholder.progress(1.0)
-                        status_placeholder.success(f"✅ Successfully loaded {len(normalized_df)} candidates!")
-
-                        set_ingestion_status(
-                            [
-                                {"label": "Mapping applied", "progress": 80},
-                                {"label": "Load complete!", "progress": 100},
-                            ]
-                        )
-
-                        st.balloons()
-                        del st.session_state["raw_upload"]
-
-                    except Exception as exc:
-                        status_placeholder.error(f"❌ Load Error: {exc}")
-                        set_ingestion_status(
-                            [
-                                {"label": "Error during load", "progress": 20},
-                            ]
-                        )
-
-        with st.expander("📋 Current Data Preview (Data Editor)", expanded=False):
-            st.data_editor(
+                        st.session_state.pop("candidate_metrics", None)
+
+                    status_placeholder.success(f"✅ Successfully loaded {len(normalized_df)} candidates!")
+                    set_ingestion_status(
+                        [
+                            {"label": "Mapping applied", "progress": 80},
+                            {"label": "Load complete!", "progress": 100},
+                        ]
+                    )
+
+                    st.balloons()
+                    del st.session_state["raw_upload"]
+
+                except Exception as exc:
+                    status_placeholder.error(f"❌ Load Error: {exc}")
+                    set_ingestion_status(
+                        [
+                            {"label": "Error during load", "progress": 20},
+                        ]
+                    )
+
+        with st.expander("📋 Current Data Preview", expanded=False):
+            st.dataframe(
                 st.session_state.get("candidates_df", pd.DataFrame()),
-                disabled=True,
                 use_container_width=True,
                 height=300,
             )
@@ -220,6 +318,7 @@ def tab_load_candidates():
     render_processing_status()
 
 
+@st.fragment
 def tab_view_candidates():
     """Tab 2: Data Overview with Metrics and Enhanced Dataframe."""
     st.markdown("### 👥 View Candidates")
@@ -231,7 +330,9 @@ def tab_view_candidates():
         st.info("ℹ️ No candidate data loaded. Use **Tab 1** to import candidates.")
         return
 
-    metrics = compute_summary_metrics(df)
+    metrics = st.session_state.get("candidate_metrics")
+    if metrics is None:
+        metrics = st.session_state["candidate_metrics"] = compute_summary_metrics(df)
 
     col1, col2, col3, col4 = st.columns(4, gap="medium")
 
@@ -308,16 +409,16 @@ def tab_view_candidates():
         ),
     }
 
-    st.data_editor(
+    st.dataframe(
         df,
         column_config=column_config,
-        disabled=True,
         use_container_width=True,
         height=500,
         hide_index=True,
     )
 
 
+@st.fragment
 def tab_screen_and_rank():
     """Tab 3: Screen & Rank Configuration."""
     st.markdown("### 🎯 Screen & Rank")
@@ -426,8 +527,24 @@ def tab_screen_and_rank():
                         }
                         st.session_state["screen_config"] = config
 
-                        scored_df = score_candidates(df, **config)
+                        scored_df = _cached_score(
+                            df,
+                            job_title=job_title,
+                            job_description=job_description,
+                            weights=tuple(config["weights"].items()),
+                            preferred_work_model=preferred_work_model,
+                            minimum_experience=minimum_experience,
+                            _skill_index=st.session_state.get("skill_index"),
+                        )
                         st.session_state["scored_df"] = scored_df
+                        st.session_state["top_df"] = top_candidates(scored_df, limit=7)
+                        st.session_state["scored_ids"] = tuple(scored_df["id"].to_numpy().tolist())
+                        st.session_state["scored_by_id"] = (
+                            scored_df.drop_duplicates("id").set_index("id", drop=False).to_dict(orient="index")
+                        )
+                        st.session_state["export_bytes"] = _serialize_export(
+                            scored_df, st.session_state["top_df"], config
+                        )
 
                         st.success(f"✅ Successfully ranked {len(scored_df)} candidates!")
                         st.balloons()
@@ -436,6 +553,7 @@ def tab_screen_and_rank():
                         st.error(f"❌ Ranking Error: {exc}")
 
 
+@st.fragment
 def tab_monitoring_results():
     """Tab 4: Monitoring Results with Grid Layout."""
     st.markdown("### 📈 Monitoring Results")
@@ -447,7 +565,7 @@ def tab_monitoring_results():
         st.info("ℹ️ No screening results yet. Use **Tab 3** to run candidate screening.")
         return
 
-    top_df = top_candidates(scored_df, limit=7)
+    top_df = st.session_state.get("top_df", pd.DataFrame())
 
     st.markdown("#### 🏆 Top 7 Candidates")
     st.caption("Highest-scoring profiles from the screening")
@@ -456,33 +574,20 @@ def tab_monitoring_results():
         st.warning("No top candidates found.")
         return
 
-    rows = list(top_df.to_dict(orient="records"))
-    for row_items in chunked(rows, 3):
-        cols = st.columns(len(row_items))
-        for idx, candidate in enumerate(row_items):
-            with cols[idx]:
-                rec = candidate.get("recommendation", "Pending")
-                rec_class = (
-                    "recommendation-strong"
-                    if rec == "Strong"
-                    else "recommendation-balanced" if rec == "Balanced" else "recommendation-watch"
-                )
-                st.markdown(
-                    f"""
-                    <div class="screening-box candidate-card">
-                        <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 1rem;">
-                            <h4 style="margin: 0; color: var(--text-primary);">{candidate.get("full_name", "Unknown")}</h4>
-                            <span class="recommendation-badge {rec_class}">{rec}</span>
-                        </div>
-                        <p style="margin: 0.5rem 0; font-size: 0.9rem;"><strong>Score:</strong> {candidate.get("match_score", 0):.1f}</p>
-                        <p style="margin: 0.5rem 0; font-size: 0.9rem;"><strong>Role:</strong> {candidate.get("current_role", "—")}</p>
-                        <p style="margin: 0.5rem 0; font-size: 0.9rem;"><strong>Experience:</strong> {candidate.get("experience_years", 0)} years</p>
-                        <p style="margin: 0.5rem 0; font-size: 0.9rem;"><strong>Location:</strong> {candidate.get("location", "—")}</p>
-                        <p style="margin: 0.5rem 0; font-size: 0.9rem;"><strong>Work Model:</strong> {candidate.get("work_model", "—")}</p>
-                    </div>
-                    """,
-                    unsafe_allow_html=True,
-                )
+    cards_html = "".join(
+        CANDIDATE_CARD_TEMPLATE.safe_substitute(
+            full_name=candidate.full_name,
+            rec_class=REC_CLASS.get(candidate.recommendation, "recommendation-watch"),
+            recommendation=candidate.recommendation,
+            match_score=f"{candidate.match_score:.1f}",
+            current_role=candidate.current_role,
+            experience_years=candidate.experience_years,
+            location=candidate.location,
+            work_model=candidate.work_model,
+        )
+        for candidate in top_df.itertuples(index=False)
+    )
+    st.markdown(f'<div class="candidate-grid">{cards_html}</div>', unsafe_allow_html=True)
 
     st.markdown("---")
     st.markdown("#### 📋 Full Rankings Table")
@@ -504,10 +609,9 @@ def tab_monitoring_results():
         "work_model": st.column_config.TextColumn("Work Model", width="small"),
     }
 
-    st.data_editor(
+    st.dataframe(
         scored_df,
         column_config=column_config,
-        disabled=True,
         use_container_width=True,
         height=400,
         hide_index=True,
@@ -518,60 +622,47 @@ def tab_monitoring_results():
 
     selected_id = st.selectbox(
         "Select Candidate ID to View Details",
-        scored_df["id"].tolist(),
+        st.session_state["scored_ids"],
     )
 
     if selected_id:
-        candidate = scored_df[scored_df["id"] == selected_id].iloc[0].to_dict()
+        candidate = st.session_state["scored_by_id"][selected_id]
         rec = candidate.get("recommendation", "Pending")
-        rec_class = (
-            "recommendation-strong"
-            if rec == "Strong"
-            else "recommendation-balanced" if rec == "Balanced" else "recommendation-watch"
-        )
-
         st.markdown(
-            f"""
-            <div class="screening-box">
-                <div style="display: flex; justify-content: space-between; align-items: center;">
-                    <h3 style="margin: 0; color: var(--text-primary);">{candidate.get("full_name", "Unknown")}</h3>
-                    <span class="recommendation-badge {rec_class}">{rec}</span>
-                </div>
-                <hr style="margin: 1rem 0;">
-                <p><strong>Match Score:</strong> {candidate.get("match_score", 0):.1f}</p>
-                <p><strong>Current Role:</strong> {candidate.get("current_role", "—")}</p>
-                <p><strong>Experience:</strong> {candidate.get("experience_years", 0)} years</p>
-                <p><strong>Email:</strong> {candidate.get("email", "—")}</p>
-                <p><strong>Location:</strong> {candidate.get("location", "—")}</p>
-                <p><strong>Work Model:</strong> {candidate.get("work_model", "—")}</p>
-                <p><strong>Availability:</strong> {candidate.get("availability", "—")}</p>
-                <hr style="margin: 1rem 0;">
-                <p><strong>Skills:</strong> {", ".join(candidate.get("skills", []))}</p>
-            </div>
-            """,
+            CANDIDATE_PROFILE_TEMPLATE.safe_substitute(
+                full_name=candidate.get("full_name", "Unknown"),
+                rec_class=REC_CLASS.get(rec, "recommendation-watch"),
+                recommendation=rec,
+                match_score=f"{candidate.get('match_score', 0):.1f}",
+                current_role=candidate.get("current_role", "—"),
+                experience_years=candidate.get("experience_years", 0),
+                email=candidate.get("email", "—"),
+                location=candidate.get("location", "—"),
+                work_model=candidate.get("work_model", "—"),
+                availability=candidate.get("availability", "—"),
+                skills=", ".join(candidate.get("skills", [])),
+            ),
             unsafe_allow_html=True,
         )
 
     st.markdown("---")
     st.markdown("#### 💾 Export Results")
 
-    export_data = {
-        "screen_config": st.session_state.get("screen_config", {}),
-        "top_candidates": top_df.to_dict(orient="records"),
-        "all_rankings": scored_df.to_dict(orient="records"),
-    }
-
     col_export_1, col_export_2, col_export_3 = st.columns([1, 2, 1])
     with col_export_2:
         st.download_button(
             label="📥 Download Rankings (JSON)",
-            data=json.dumps(export_data, indent=2, default=str),
+            data=st.session_state["export_bytes"],
             file_name="eureka_results.json",
             mime="application/json",
             use_container_width=True,
         )
 
 
+def _set_tab(tab_key: str):
+    st.session_state["current_tab"] = tab_key
+
+
 def render_sticky_tabs():
     """Render fixed/sticky tabs that don't scroll with content."""
     tab_options = [
@@ -587,14 +678,14 @@ def render_sticky_tabs():
     col_tabs = st.columns(len(tab_options), gap="small")
     for idx, (label, tab_key) in enumerate(tab_options):
         with col_tabs[idx]:
-            if st.button(
+            st.button(
                 label,
                 key=f"tab_{tab_key}",
                 use_container_width=True,
                 type="primary" if st.session_state["current_tab"] == tab_key else "secondary",
-            ):
-                st.session_state["current_tab"] = tab_key
-                st.rerun()
+                on_click=_set_tab,
+                args=(tab_key,),
+            )
 
     st.markdown("---")
 
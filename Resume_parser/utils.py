@@ -4,10 +4,13 @@ from __future__ import annotations
 import io
 import json
 import re
-from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
 
 import httpx
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 
 from .constants import (
     DEFAULT_COLUMN_MAPPING,
@@ -16,42 +19,81 @@ from .constants import (
     REQUIRED_FIELDS,
 )
 
-STOP_WORDS = {
-    "and",
-    "the",
-    "with",
-    "for",
-    "to",
-    "of",
-    "in",
-    "a",
-    "an",
-    "is",
-    "on",
-    "as",
-    "be",
-    "by",
-    "at",
-}
+SkillIndex = Tuple[Dict[str, int], np.ndarray, np.ndarray]
+
+STOP_WORDS = frozenset(
+    {
+        "and",
+        "the",
+        "with",
+        "for",
+        "to",
+        "of",
+        "in",
+        "a",
+        "an",
+        "is",
+        "on",
+        "as",
+        "be",
+        "by",
+        "at",
+    }
+)
+
+_SKILL_SPLIT_RE = re.compile(r"[\n\r,;•|/]")
+_GID_RE = re.compile(r"gid=(\d+)")
+_SHEET_ID_RE = re.compile(r"/spreadsheets/d/([a-zA-Z0-9-_]+)")
+_TOKEN_RE = re.compile(r"[a-z0-9+#]{3,}")
+
+# Shared client so repeated sheet fetches reuse pooled keep-alive connections.
+_HTTP_CLIENT = httpx.Client(
+    timeout=20.0, follow_redirects=True, limits=httpx.Limits(max_keepalive_connections=8)
+)
 
 
 def normalize_skill_value(value: object) -> List[str]:
     """Convert different formats into a clean list of skills/keywords."""
-    if isinstance(value, list):
-        return [str(item).strip() for item in value if str(item).strip()]
-    if isinstance(value, (set, tuple)):
-        return [str(item).strip() for item in value if str(item).strip()]
     if isinstance(value, str):
-        separators = r"[\n\r,;•|/]"
-        tokens = [token.strip() for token in re.split(separators, value) if token.strip()]
+        tokens = [token.strip() for token in _SKILL_SPLIT_RE.split(value) if token.strip()]
         return tokens
+    if pd.api.types.is_list_like(value):
+        # Lists, tuples, sets and the ndarrays Parquet list columns arrive as.
+        return [str(item).strip() for item in value if str(item).strip()]
     if pd.isna(value):  # type: ignore[arg-type]
         return []
     return [str(value).strip()]
 
 
+def _normalize_skill_column(values: pd.Series) -> pd.Series:
+    """Column-wise ``normalize_skill_value`` with a vectorized path for delimited text."""
+    if pd.api.types.infer_dtype(values, skipna=True) not in ("string", "empty"):
+        return values.apply(normalize_skill_value)
+    tokens = values.fillna("").str.strip().str.split(r"\s*[\n\r,;•|/]\s*", regex=True)
+    return pd.Series([[token for token in row if token] for row in tokens], index=values.index, dtype=object)
+
+
+def _cast_null_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Retype all-blank ``null[pyarrow]`` columns as strings so ``fillna`` works on them."""
+    null_columns = {
+        column: pd.ArrowDtype(pa.string())
+        for column, dtype in df.dtypes.items()
+        if isinstance(dtype, pd.ArrowDtype) and pa.types.is_null(dtype.pyarrow_dtype)
+    }
+    return df.astype(null_columns) if null_columns else df
+
+
+def _read_csv(buffer) -> pd.DataFrame:
+    """Parse CSV with the multithreaded PyArrow reader, falling back to the C engine."""
+    try:
+        return _cast_null_columns(pd.read_csv(buffer, engine="pyarrow", dtype_backend="pyarrow"))
+    except (ImportError, ValueError):
+        buffer.seek(0)
+        return pd.read_csv(buffer, low_memory=False, cache_dates=True)
+
+
 def parse_uploaded_file(uploaded_file) -> pd.DataFrame:
-    """Parse CSV, Excel, or JSON files uploaded locally."""
+    """Parse CSV, Excel, JSON, or Parquet files uploaded locally."""
     if uploaded_file is None:
         raise ValueError("No file supplied.")
 
@@ -59,9 +101,11 @@ def parse_uploaded_file(uploaded_file) -> pd.DataFrame:
     uploaded_file.seek(0)
 
     if file_name.endswith(".csv"):
-        return pd.read_csv(uploaded_file)
+        return _read_csv(uploaded_file)
     if file_name.endswith((".xlsx", ".xls")):
-        return pd.read_excel(uploaded_file)
+        return pd.read_excel(uploaded_file, engine="calamine")
+    if file_name.endswith(".parquet"):
+        return _cast_null_columns(pd.read_parquet(uploaded_file, engine="pyarrow", dtype_backend="pyarrow"))
     if file_name.endswith(".json"):
         data = json.load(uploaded_file)
         if isinstance(data, dict):
@@ -69,17 +113,18 @@ def parse_uploaded_file(uploaded_file) -> pd.DataFrame:
         if isinstance(data, list):
             return pd.DataFrame(data)
         raise ValueError("JSON structure must be a list of candidate objects.")
-    raise ValueError("Supported formats: CSV, XLSX, XLS, JSON.")
+    raise ValueError("Supported formats: CSV, XLSX, XLS, JSON, PARQUET.")
 
 
+@lru_cache(maxsize=256)
 def extract_sheet_identifiers(value: str) -> Tuple[Optional[str], Optional[str]]:
     if not value:
         return None, None
     value = value.strip()
-    gid_match = re.search(r"gid=(\d+)", value)
+    gid_match = _GID_RE.search(value)
     gid = gid_match.group(1) if gid_match else None
     if "docs.google.com" in value:
-        match = re.search(r"/spreadsheets/d/([a-zA-Z0-9-_]+)", value)
+        match = _SHEET_ID_RE.search(value)
         sheet_id = match.group(1) if match else None
         return sheet_id, gid
     return value, gid
@@ -95,14 +140,14 @@ def fetch_google_sheet(sheet_value: str) -> pd.DataFrame:
         csv_url += f"&gid={gid}"
 
     try:
-        response = httpx.get(csv_url, timeout=20.0)
+        response = _HTTP_CLIENT.get(csv_url)
         response.raise_for_status()
     except httpx.HTTPStatusError as exc:
         raise ValueError(f"Google Sheets returned status {exc.response.status_code}.") from exc
     except httpx.RequestError as exc:
         raise ConnectionError("Unable to reach Google Sheets. Check the URL or your connection.") from exc
 
-    return pd.read_csv(io.StringIO(response.text))
+    return _read_csv(io.BytesIO(response.content))
 
 
 def apply_column_mapping(df: pd.DataFrame, mapping: Dict[str, Optional[str]]) -> pd.DataFrame:
@@ -128,7 +173,7 @@ def apply_column_mapping(df: pd.DataFrame, mapping: Dict[str, Optional[str]]) ->
         normalized["experience_years"], errors="coerce"
     ).fillna(0.0)
 
-    normalized["skills"] = normalized["skills"].apply(normalize_skill_value)
+    normalized["skills"] = _normalize_skill_column(normalized["skills"])
 
     if "work_model" not in normalized.columns:
         normalized["work_model"] = "Hybrid"
@@ -159,8 +204,10 @@ def compute_summary_metrics(df: pd.DataFrame) -> Dict[str, object]:
             "remote_ready": 0,
         }
 
-    immediate_ready = df["availability"].fillna("").str.contains("immediate", case=False, na=False).sum()
-    remote_ready = df["work_model"].fillna("").str.contains("remote", case=False, na=False).sum()
+    immediate_ready = (
+        df["availability"].fillna("").str.lower().str.contains("immediate", regex=False, na=False).sum()
+    )
+    remote_ready = df["work_model"].fillna("").str.lower().str.contains("remote", regex=False, na=False).sum()
 
     return {
         "total": int(len(df)),
@@ -170,50 +217,83 @@ def compute_summary_metrics(df: pd.DataFrame) -> Dict[str, object]:
     }
 
 
-def extract_job_keywords(job_title: str, job_description: str) -> List[str]:
+@lru_cache(maxsize=1024)
+def extract_job_keywords(job_title: str, job_description: str) -> Tuple[str, ...]:
     combined = f"{job_title or ''} {job_description or ''}".lower()
-    tokens = re.findall(r"[a-z0-9+#]{3,}", combined)
-    keywords = sorted({token for token in tokens if token not in STOP_WORDS})
-    return keywords
+    tokens = _TOKEN_RE.findall(combined)
+    return tuple(sorted({token for token in tokens if token not in STOP_WORDS}))
 
 
-def _skill_alignment(candidate_skills: List[str], keywords: Sequence[str]) -> float:
-    if not keywords:
-        return 0.7
-    skills = {skill.lower() for skill in candidate_skills}
-    matched = len(skills.intersection(set(keywords)))
-    return min(1.0, matched / max(1, len(keywords) * 0.5))
+def build_skill_index(skills: pd.Series) -> SkillIndex:
+    """Encode each candidate's lower-cased skills as (vocabulary, row ids, skill ids)."""
+    vocabulary: Dict[str, int] = {}
+    row_ids: List[int] = []
+    skill_ids: List[int] = []
+    for row, values in enumerate(skills):
+        for skill_id in {vocabulary.setdefault(value.lower(), len(vocabulary)) for value in values}:
+            row_ids.append(row)
+            skill_ids.append(skill_id)
+    return vocabulary, np.asarray(row_ids, dtype=np.int64), np.asarray(skill_ids, dtype=np.int64)
 
 
-def _experience_fit(experience: float, minimum: int) -> float:
+def _skill_alignment(
+    skills: pd.Series, keywords: Sequence[str], skill_index: Optional[SkillIndex] = None
+) -> np.ndarray:
+    if not keywords:
+        return np.full(len(skills), 0.7)
+    if skill_index is None:
+        keyword_set = frozenset(keywords)
+        matched = np.fromiter(
+            (len(keyword_set.intersection(map(str.lower, values))) for values in skills),
+            dtype=float,
+            count=len(skills),
+        )
+    else:
+        vocabulary, row_ids, skill_ids = skill_index
+        keyword_ids = [vocabulary[keyword] for keyword in keywords if keyword in vocabulary]
+        matched = np.bincount(row_ids, weights=np.isin(skill_ids, keyword_ids), minlength=len(skills))
+    return np.minimum(1.0, matched / max(1, len(keywords) * 0.5))
+
+
+def _experience_fit(experience: pd.Series, minimum: int) -> np.ndarray:
     if minimum <= 0:
-        return 1.0
-    ratio = experience / float(minimum)
-    if ratio >= 1:
-        return 1.0
-    return max(0.2, ratio)
+        return np.ones(len(experience))
+    return np.clip(experience.to_numpy(dtype=float) / float(minimum), 0.2, 1.0)
 
 
-def _culture_fit(work_model: str, preferred: str) -> float:
-    work_model = (work_model or "Hybrid").strip().title()
+def _culture_fit(work_models: pd.Series, preferred: str) -> np.ndarray:
     preferred = (preferred or "Hybrid").strip().title()
-    if work_model == preferred:
-        return 1.0
-    if preferred == "Hybrid":
-        return 0.85
-    if work_model == "Hybrid":
-        return 0.9
-    return 0.55
+    # Work models take a handful of distinct values; score those once and broadcast.
+    codes, uniques = pd.factorize(work_models.fillna("Hybrid").astype(str).replace("", "Hybrid"))
+    normalized = pd.Index(uniques).str.strip().str.title()
+    hybrid_score = 1.0 if preferred == "Hybrid" else 0.9
+    other_score = 0.85 if preferred == "Hybrid" else 0.55
+    score_map = {preferred: 1.0, "Hybrid": hybrid_score}
+    lookup = np.fromiter(
+        (score_map.get(value, other_score) for value in normalized), dtype=float, count=len(normalized)
+    )
+    return lookup[codes]
+
+
+STRONG_THRESHOLD = 85
+BALANCED_THRESHOLD = 70
 
 
 def classify_recommendation(score: float) -> str:
-    if score >= 85:
+    if score >= STRONG_THRESHOLD:
         return "Strong"
-    if score >= 70:
+    if score >= BALANCED_THRESHOLD:
         return "Balanced"
     return "Watch"
 
 
+def _classify_recommendations(scores: np.ndarray) -> np.ndarray:
+    """Vectorized ``classify_recommendation`` over an array of match scores."""
+    return np.select(
+        [scores >= STRONG_THRESHOLD, scores >= BALANCED_THRESHOLD], ["Strong", "Balanced"], default="Watch"
+    )
+
+
 def score_candidates(
     df: pd.DataFrame,
     *,
@@ -222,6 +302,7 @@ def score_candidates(
     weights: Dict[str, int],
     preferred_work_model: str,
     minimum_experience: int,
+    skill_index: Optional[SkillIndex] = None,
 ) -> pd.DataFrame:
     if df is None or df.empty:
         return pd.DataFrame()
@@ -230,43 +311,50 @@ def score_candidates(
     total_weight = sum(weights.values()) or 1
     normalized_weights = {key: value / total_weight for key, value in weights.items()}
 
-    scored = df.copy()
-    scored["skills_alignment_score"] = scored["skills"].apply(lambda skills: _skill_alignment(skills, keywords))
-    scored["experience_fit_score"] = scored["experience_years"].apply(
-        lambda val: _experience_fit(val, minimum_experience)
-    )
-    scored["culture_impact_score"] = scored["work_model"].apply(
-        lambda val: _culture_fit(val, preferred_work_model)
+    skills_alignment = _skill_alignment(df["skills"], keywords, skill_index)
+    experience_fit = _experience_fit(df["experience_years"], minimum_experience)
+    culture_impact = _culture_fit(df["work_model"], preferred_work_model)
+    match_score = np.round(
+        (
+            skills_alignment * normalized_weights.get("skills_alignment", 0)
+            + experience_fit * normalized_weights.get("experience_fit", 0)
+            + culture_impact * normalized_weights.get("culture_impact", 0)
+        )
+        * 100,
+        1,
     )
 
-    scored["match_score"] = (
-        scored["skills_alignment_score"] * normalized_weights.get("skills_alignment", 0)
-        + scored["experience_fit_score"] * normalized_weights.get("experience_fit", 0)
-        + scored["culture_impact_score"] * normalized_weights.get("culture_impact", 0)
-    ) * 100
-
-    scored["match_score"] = scored["match_score"].round(1)
-    scored["recommendation"] = scored["match_score"].apply(classify_recommendation)
-
-    return scored.sort_values("match_score", ascending=False).reset_index(drop=True)
+    # Reorder once up front; the take is the only copy of the candidate columns.
+    order = np.argsort(-match_score, kind="stable")
+    match_score = match_score[order]
+    scored = df.take(order)
+    scored.index = pd.RangeIndex(len(scored))
+    scored["skills_alignment_score"] = skills_alignment[order]
+    scored["experience_fit_score"] = experience_fit[order]
+    scored["culture_impact_score"] = culture_impact[order]
+    scored["match_score"] = match_score
+    scored["recommendation"] = _classify_recommendations(match_score)
+    return scored
 
 
 def top_candidates(df: pd.DataFrame, limit: int = MAX_TOP_CANDIDATES) -> pd.DataFrame:
     if df is None or df.empty:
         return pd.DataFrame()
-    return df.nlargest(limit, "match_score").reset_index(drop=True)
+    if limit <= 0:
+        return df.iloc[:0].reset_index(drop=True)
+    scores = df["match_score"].to_numpy(dtype=float)
+    # Like nlargest: NaN scores are never picked, and cut-off ties go to the earliest rows.
+    picked = np.flatnonzero(~np.isnan(scores))
+    if limit < len(picked):
+        valid = scores[picked]
+        kth = -np.partition(-valid, limit - 1)[limit - 1]
+        above = picked[valid > kth]
+        ties = picked[valid == kth][: limit - len(above)]
+        picked = np.concatenate([above, ties])
+    order = picked[np.lexsort((picked, -scores[picked]))]
+    return df.take(order).reset_index(drop=True)
 
 
 def recommendation_color(label: str) -> str:
     return RECOMMENDATION_COLORS.get(label, "#6B7280")
 
-
-def chunked(items: Sequence[Dict[str, object]], chunk_size: int) -> Iterable[List[Dict[str, object]]]:
-    chunk: List[Dict[str, object]] = []
-    for item in items:
-        chunk.append(item)
-        if len(chunk) == chunk_size:
-            yield chunk
-            chunk = []
-    if chunk:
-        yield chunk
@@ -59,8 +59,20 @@ DEFAULT_CHAIRMAN_MODEL = ParticipantModel(
     ),
 )
 
+PARTICIPANTS_BY_ROLE: dict[str, ParticipantModel] = {
+    participant.role: participant for participant in DEFAULT_PARTICIPANTS
+}
+
+# Participants are frozen, so their serialized form can be computed once at import.
+DEFAULT_PARTICIPANT_DUMPS: dict[str, dict[str, Any]] = {
+    role: participant.model_dump() for role, participant in PARTICIPANTS_BY_ROLE.items()
+}
+DEFAULT_CHAIRMAN_DUMP: dict[str, Any] = DEFAULT_CHAIRMAN_MODEL.model_dump()
+
 T = TypeVar("T")
 _FALLBACK_SESSION_STATE: dict[str, Any] = {}
+_MISSING = object()
+_SECRET_CACHE: dict[str, str] = {}
 
 
 def _session_state() -> MutableMapping[str, Any]:
@@ -76,9 +88,11 @@ def get_or_init_session_state(key: str, default: T) -> T:
     """Return a session value, seeding it with *default* if unset."""
 
     state = _session_state()
-    if key not in state:
+    value = state.get(key, _MISSING)
+    if value is _MISSING:
         state[key] = default
-    return state[key]
+        return default
+    return value
 
 
 def persist_user_selections(key: str, selections: Sequence[str]) -> list[str]:
@@ -90,12 +104,19 @@ def persist_user_selections(key: str, selections: Sequence[str]) -> list[str]:
 
 
 def _get_secret_from_streamlit(key: str) -> str | None:
-    """Safely fetch a key from Streamlit secrets if available."""
+    """Safely fetch a key from Streamlit secrets, caching it once it is found."""
 
+    cached = _SECRET_CACHE.get(key)
+    if cached:
+        return cached
     try:
-        return st.secrets.get(key)  # type: ignore[attr-defined]
+        value = st.secrets.get(key)  # type: ignore[attr-defined]
     except Exception:  # pragma: no cover - depends on Streamlit runtime
         return None
+    # Misses are not cached so secrets added while the server runs are picked up.
+    if value:
+        _SECRET_CACHE[key] = value
+    return value
 
 
 def get_openrouter_api_key(require: bool = True) -> str | None:
@@ -125,6 +146,9 @@ __all__ = [
     "ParticipantModel",
     "DEFAULT_PARTICIPANTS",
     "DEFAULT_CHAIRMAN_MODEL",
+    "PARTICIPANTS_BY_ROLE",
+    "DEFAULT_PARTICIPANT_DUMPS",
+    "DEFAULT_CHAIRMAN_DUMP",
     "get_openrouter_api_key",
     "get_or_init_session_state",
     "persist_user_selections",
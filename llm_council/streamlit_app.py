@@ -6,8 +6,9 @@ from typing import List
 import streamlit as st
 
 from config import (
-    DEFAULT_CHAIRMAN_MODEL,
-    DEFAULT_PARTICIPANTS,
+    DEFAULT_CHAIRMAN_DUMP,
+    DEFAULT_PARTICIPANT_DUMPS,
+    PARTICIPANTS_BY_ROLE,
     get_openrouter_api_key,
     get_or_init_session_state,
     persist_user_selections,
@@ -22,11 +23,11 @@ st.set_page_config(
 
 
 def _build_participant_summary(selected_roles: List[str]) -> list[dict[str, object]]:
-    summaries: list[dict[str, object]] = []
-    for participant in DEFAULT_PARTICIPANTS:
-        if participant.role in selected_roles:
-            summaries.append(participant.model_dump())
-    return summaries
+    return [
+        DEFAULT_PARTICIPANT_DUMPS[role]
+        for role in selected_roles
+        if role in PARTICIPANTS_BY_ROLE
+    ]
 
 
 def main() -> None:
@@ -44,7 +45,7 @@ def main() -> None:
             "Streamlit secrets to enable API calls."
         )
 
-    participant_roles = [participant.role for participant in DEFAULT_PARTICIPANTS]
+    participant_roles = list(PARTICIPANTS_BY_ROLE)
     default_selection = get_or_init_session_state("selected_participants", participant_roles)
 
     selected_roles = st.multiselect(
@@ -62,7 +63,7 @@ def main() -> None:
         st.info("Select at least one participant to inspect their configuration.")
 
     st.subheader("Chairperson model")
-    st.json(DEFAULT_CHAIRMAN_MODEL.model_dump(), expanded=False)
+    st.json(DEFAULT_CHAIRMAN_DUMP, expanded=False)
 
     st.markdown(
         "This starter view intentionally avoids making network calls so that you can "